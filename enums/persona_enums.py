@@ -0,0 +1,6 @@
+from enum import Enum
+
+class PersonaEnum(str, Enum):
+    """Audiences a summary can be generated for."""
+    DEVELOPER = "developer"
+    BUSINESS_ANALYST = "business_analyst"
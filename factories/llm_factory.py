@@ -5,6 +5,7 @@ from langchain_openai import ChatOpenAI
 from langchain_groq import ChatGroq
 
 from enums.llm_provider_enums import LlmProviderEnum
+from helpers.provider_helper import resolve_provider
 
 def get_llm(
     provider: Optional[LlmProviderEnum] = None,
@@ -16,11 +17,11 @@ def get_llm(
     Supports OpenAI and Groq providers.
 
     Args:
-        provider: "openai" or "groq" (default: "openai")
+        provider: "openai" or "groq" (default: LLM_PROVIDER, then "groq")
         model: model name (optional)
         temperature: sampling temperature (default 0.2)
     """
-    provider = (provider or os.getenv("LLM_PROVIDER") or LlmProviderEnum.OPENAI).lower()
+    provider = resolve_provider(provider)
     temperature = temperature if temperature is not None else 0.2
 
     if provider == "openai":
@@ -0,0 +1,10 @@
+import os
+from typing import Optional
+
+from enums.llm_provider_enums import LlmProviderEnum
+
+def resolve_provider(provider: Optional[str] = None) -> str:
+    """
+    Resolve the LLM provider to use: explicit value, then LLM_PROVIDER, then Groq.
+    """
+    return (provider or os.getenv("LLM_PROVIDER") or LlmProviderEnum.GROQ).lower()
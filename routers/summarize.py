@@ -1,7 +1,7 @@
-from fastapi import APIRouter
-from enums.llm_provider_enums import LlmProviderEnum
+from fastapi import APIRouter, HTTPException
 from schema.summarize import SummarizeRequest, SummarizeResponse
 from services.jira import get_issue_summary
+from services.model_router import infer_provider
 from services.summarizer import summarize_with_langchain_async
 import asyncio
 
@@ -14,6 +14,13 @@ async def summarize_endpoint(request: SummarizeRequest):
     Returns separate summaries for developers and business analysts.
     """
     print("Incoming request: ", request)
+    # Reject a pinned model we can't place with a provider before calling Jira/the LLM
+    if request.model:
+        try:
+            infer_provider(request.model, request.provider)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+
     # try:
     ticket_summary = await asyncio.to_thread(get_issue_summary, str(request.url))
     # Scrape the ticket content (blocking operation) in a separate thread
@@ -25,14 +32,21 @@ async def summarize_endpoint(request: SummarizeRequest):
     # raise Exception(f'Cleaned text exception: {clean_text}')
 
     # Generate summaries (blocking operation) in a separate thread
-    developer_summary, business_summary = await summarize_with_langchain_async(
-        ticket_summary, LlmProviderEnum.GROQ
+    # Model is routed from the ticket's size/complexity unless the request pins one
+    developer_summary, business_summary, provider, model = await summarize_with_langchain_async(
+        ticket_summary,
+        provider=request.provider,
+        model=request.model,
+        persona=request.persona,
+        deadline_seconds=request.deadline_seconds,
     )
 
     # Return the summaries as a JSON response
     return SummarizeResponse(
         developer_summary=developer_summary,
-        business_summary=business_summary
+        business_summary=business_summary,
+        provider=provider,
+        model=model,
     )
     # except Exception as e:
     #     # In production, use proper logging instead of print
@@ -1,14 +1,31 @@
-from pydantic import BaseModel, HttpUrl
+from typing import Optional
+from pydantic import BaseModel, Field, HttpUrl
+
+from enums.llm_provider_enums import LlmProviderEnum
+from enums.persona_enums import PersonaEnum
 
 class SummarizeRequest(BaseModel):
     """
     Request schema for summarization endpoint.
+    Provider, model and persona are optional; when the model is omitted
+    the router picks one from the ticket's size and complexity.
     """
     url: HttpUrl
+    provider: Optional[LlmProviderEnum] = None
+    model: Optional[str] = None
+    persona: Optional[PersonaEnum] = None
+    deadline_seconds: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Latency budget used to steer automatic model selection.",
+    )
 
 class SummarizeResponse(BaseModel):
     """
     Response schema containing developer and business summaries.
+    A summary is null when the request asked for the other persona only.
     """
-    developer_summary: str
-    business_summary: str
+    developer_summary: Optional[str] = None
+    business_summary: Optional[str] = None
+    provider: Optional[LlmProviderEnum] = None
+    model: Optional[str] = None
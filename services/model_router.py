@@ -0,0 +1,208 @@
+# services/model_router.py
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from enums.llm_provider_enums import LlmProviderEnum
+from helpers.provider_helper import resolve_provider
+
+# Weight given to the newest observation in the moving averages.
+EWMA_ALPHA = 0.3
+
+# Token overhead of the summarizer prompt template around the ticket brief,
+# and a typical summary length. Used to price a request before it is sent.
+PROMPT_OVERHEAD_TOKENS = 350
+EXPECTED_OUTPUT_TOKENS = 500
+
+# Markers that usually mean the ticket needs real technical reasoning.
+# Each marker type counts once, however often it appears.
+_TECHNICAL_MARKERS = [
+    re.compile(r"\btraceback\b", re.IGNORECASE),
+    re.compile(r"\b\w*exception\b", re.IGNORECASE),
+    re.compile(r"\bstack ?trace\b", re.IGNORECASE),
+    re.compile(r"```|\{code"),
+    re.compile(r"\bat [\w.$]+\("),
+    re.compile(r"\bsql\b", re.IGNORECASE),
+    re.compile(r"\bnull ?pointer\b", re.IGNORECASE),
+]
+
+# (provider, model) -> {"latency_s", "token_ratio", "calls"}
+# token_ratio is billed tokens / estimated tokens, applied to the list price.
+_observed_stats: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+
+def get_model_catalogue() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Candidate models per provider, ordered from smallest/fastest to largest.
+    latency_s is a prior replaced by observed values once calls are recorded;
+    cost_per_1k_tokens is the list price. Model names are read from the
+    environment on every call so values loaded from .env are honoured.
+    """
+    return {
+        LlmProviderEnum.GROQ.value: [
+            {
+                "model": os.getenv("GROQ_SMALL_MODEL", "llama-3.1-8b-instant"),
+                "tier": "small",
+                "latency_s": 1.0,
+                "cost_per_1k_tokens": 0.00008,
+            },
+            {
+                "model": os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile"),
+                "tier": "large",
+                "latency_s": 3.0,
+                "cost_per_1k_tokens": 0.0008,
+            },
+        ],
+        LlmProviderEnum.OPENAI.value: [
+            {
+                "model": os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+                "tier": "small",
+                "latency_s": 3.0,
+                "cost_per_1k_tokens": 0.0006,
+            },
+            {
+                "model": os.getenv("OPENAI_LARGE_MODEL", "gpt-4o"),
+                "tier": "large",
+                "latency_s": 6.0,
+                "cost_per_1k_tokens": 0.01,
+            },
+        ],
+    }
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (about 4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+def score_ticket_complexity(ticket_brief: Dict[str, str]) -> int:
+    """
+    Score how demanding a ticket brief is. Points are added for a long
+    description, many comments, distinct technical markers (up to 2),
+    and overall size.
+    """
+    large_ticket_chars = int(os.getenv("ROUTER_LARGE_TICKET_CHARS", "4000"))
+    description = ticket_brief.get("description", "") or ""
+    comments = ticket_brief.get("last_comments", "") or ""
+    full_text = " ".join(str(v) for v in ticket_brief.values())
+
+    score = 0
+    if len(description) > large_ticket_chars // 2:
+        score += 1
+    comment_count = 0 if comments == "None" else comments.count("\n") + 1
+    if comment_count >= 5:
+        score += 1
+    marker_types = sum(1 for marker in _TECHNICAL_MARKERS if marker.search(full_text))
+    score += min(2, marker_types)
+    if len(full_text) > large_ticket_chars:
+        score += 1
+    return score
+
+
+def infer_provider(model: str, provider: Optional[str] = None) -> str:
+    """
+    Resolve the provider for a pinned model. An explicit provider is trusted;
+    otherwise the model must appear in one of the catalogues.
+    Raises ValueError if the provider cannot be determined.
+    """
+    if provider:
+        return resolve_provider(provider)
+    for name, candidates in get_model_catalogue().items():
+        if any(c["model"] == model for c in candidates):
+            return name
+    raise ValueError(f"Unknown model '{model}': specify a provider to use it.")
+
+
+def _expected_latency(provider: str, candidate: Dict[str, Any]) -> float:
+    stats = _observed_stats.get((provider, candidate["model"]))
+    return stats["latency_s"] if stats else candidate["latency_s"]
+
+
+def _expected_cost(provider: str, candidate: Dict[str, Any], tokens: int) -> float:
+    stats = _observed_stats.get((provider, candidate["model"]))
+    token_ratio = stats["token_ratio"] if stats else 1.0
+    return tokens * token_ratio / 1000 * candidate["cost_per_1k_tokens"]
+
+
+def select_model(
+    ticket_brief: Dict[str, str],
+    provider: Optional[str] = None,
+    deadline_seconds: Optional[float] = None,
+    calls: int = 1,
+) -> Tuple[str, str]:
+    """
+    Pick a (provider, model) pair for the given ticket brief.
+
+    Small, simple tickets go to the cheapest model; large or complex tickets
+    go to the large tier. When a deadline is given, models whose expected
+    latency for `calls` sequential requests exceeds it are skipped, falling
+    back to the fastest model if none fit.
+
+    Args:
+        ticket_brief: output of _build_ticket_brief(...)
+        provider: provider to route within (default: LLM_PROVIDER, then "groq")
+        deadline_seconds: optional latency budget for the whole request
+        calls: number of LLM calls the request will make
+    """
+    provider = resolve_provider(provider)
+    candidates = get_model_catalogue().get(provider)
+    if not candidates:
+        raise ValueError(f"Unsupported LLM provider: {provider}")
+
+    complexity_threshold = int(os.getenv("ROUTER_COMPLEXITY_THRESHOLD", "3"))
+    is_complex = score_ticket_complexity(ticket_brief) >= complexity_threshold
+
+    if deadline_seconds is not None:
+        within_deadline = [
+            c for c in candidates
+            if _expected_latency(provider, c) * calls <= deadline_seconds
+        ]
+        if not within_deadline:
+            fastest = min(candidates, key=lambda c: _expected_latency(provider, c))
+            return provider, fastest["model"]
+        candidates = within_deadline
+
+    if is_complex:
+        large = [c for c in candidates if c["tier"] == "large"]
+        if large:
+            return provider, large[-1]["model"]
+        # No large model fits the deadline: use the biggest one that does.
+        return provider, candidates[-1]["model"]
+
+    # Price this ticket's prompt + expected output for every candidate alike.
+    brief_tokens = estimate_tokens(" ".join(str(v) for v in ticket_brief.values()))
+    tokens = (brief_tokens + PROMPT_OVERHEAD_TOKENS + EXPECTED_OUTPUT_TOKENS) * calls
+    cheapest = min(candidates, key=lambda c: _expected_cost(provider, c, tokens))
+    return provider, cheapest["model"]
+
+
+def record_observation(
+    provider: str,
+    model: str,
+    latency_s: float,
+    estimated_tokens: int,
+    actual_tokens: Optional[int] = None,
+) -> None:
+    """
+    Fold one completed LLM call into the per-model latency/cost table.
+
+    Cost is tracked as the ratio of tokens the provider billed to our
+    estimate, so select_model can price the next ticket's estimate in the
+    same units for observed and unobserved models.
+    """
+    provider = provider.lower()
+    token_ratio = (actual_tokens / estimated_tokens) if actual_tokens and estimated_tokens else 1.0
+
+    stats = _observed_stats.get((provider, model))
+    if stats is None:
+        stats = {"latency_s": latency_s, "token_ratio": token_ratio, "calls": 0}
+        _observed_stats[(provider, model)] = stats
+    else:
+        stats["latency_s"] = EWMA_ALPHA * latency_s + (1 - EWMA_ALPHA) * stats["latency_s"]
+        stats["token_ratio"] = EWMA_ALPHA * token_ratio + (1 - EWMA_ALPHA) * stats["token_ratio"]
+    stats["calls"] += 1
+
+
+def get_model_stats() -> Dict[str, Dict[str, float]]:
+    """Return a copy of the observed latency/cost table keyed by "provider/model"."""
+    return {f"{p}/{m}": dict(s) for (p, m), s in _observed_stats.items()}
@@ -1,9 +1,12 @@
 # services/summarizer_langchain_async.py
 import json
+import time
 from typing import Any, Dict, Tuple, Optional
 from langchain_core.prompts import PromptTemplate
+from enums.persona_enums import PersonaEnum
 from enums.summarizer_prompts import SummarizerPromptsEnum
 from factories.llm_factory import get_llm
+from services.model_router import estimate_tokens, infer_provider, record_observation, select_model
 
 
 def _build_ticket_brief(ticket_details: Dict[str, Any]) -> Dict[str, str]:
@@ -35,19 +38,42 @@ async def summarize_with_langchain_async(
     provider: Optional[str] = None,
     model: Optional[str] = None,
     temperature: Optional[float] = None,
-) -> Tuple[str, str]:
+    persona: Optional[PersonaEnum] = None,
+    deadline_seconds: Optional[float] = None,
+) -> Tuple[Optional[str], Optional[str], str, str]:
     """
     Async version: generate (developer_summary, business_summary) using LangChain async calls.
 
     Args:
         ticket_details: normalized dict from get_issue_summary(...)
         provider: optional provider override (e.g., "openai")
-        model: optional model name override
+        model: optional model name override; routed automatically when omitted
         temperature: optional temperature override
+        persona: optional persona; only that summary is generated when set
+        deadline_seconds: optional latency budget used by the model router
 
     Returns:
-        (developer_summary, business_summary)
+        (developer_summary, business_summary, provider, model)
+        A summary is None when it was not requested.
     """
+    # Build compact ticket representation
+    ticket_brief = _build_ticket_brief(ticket_details)
+    ticket_str = json.dumps(ticket_brief, ensure_ascii=False, indent=2)
+
+    want_dev = persona in (None, PersonaEnum.DEVELOPER)
+    want_ba = persona in (None, PersonaEnum.BUSINESS_ANALYST)
+
+    # Pick provider/model from the ticket's size/complexity unless the caller pinned a model.
+    if model:
+        provider = infer_provider(model, provider)
+    else:
+        provider, model = select_model(
+            ticket_brief,
+            provider=provider,
+            deadline_seconds=deadline_seconds,
+            calls=int(want_dev) + int(want_ba),
+        )
+
     # Instantiate LLM from factory. The LangChain LLM must support async .arun() calls.
     # get_llm should return an LLM instance compatible with LangChain's async interface.
     llm = get_llm(provider=provider, model=model, temperature=(temperature if temperature is not None else None))
@@ -56,11 +82,6 @@ async def summarize_with_langchain_async(
     dev_template = PromptTemplate(template=SummarizerPromptsEnum.DEV_PROMPT, input_variables=["ticket"])
     ba_template = PromptTemplate(template=SummarizerPromptsEnum.BA_PROMPT, input_variables=["ticket"])
 
-
-    # Build compact ticket representation
-    ticket_brief = _build_ticket_brief(ticket_details)
-    ticket_str = json.dumps(ticket_brief, ensure_ascii=False, indent=2)
-
     try:
         dev_prompt = dev_template.format(ticket=ticket_str)
         ba_prompt = ba_template.format(ticket=ticket_str)
@@ -69,9 +90,21 @@ async def summarize_with_langchain_async(
         dev_prompt = f"{dev_template}\n\n{ticket_str}"
         ba_prompt = f"{ba_template}\n\n{ticket_str}"
 
+    async def _timed_invoke(prompt: str) -> str:
+        # Feed each call's latency and token usage back into the router's table.
+        started = time.perf_counter()
+        out = await llm.ainvoke(prompt)
+        usage = getattr(out, "usage_metadata", None) or {}
+        record_observation(
+            provider, model, time.perf_counter() - started,
+            estimated_tokens=estimate_tokens(prompt) + estimate_tokens(out.text),
+            actual_tokens=usage.get("total_tokens"),
+        )
+        return out.text
+
     # Run chains asynchronously using arun (LangChain async)
     # Note: Some LLM wrappers require async initialization; using get_llm as above should be fine for OpenAI.
-    developer_out = await llm.ainvoke(dev_prompt)
-    business_out = await llm.ainvoke(ba_prompt)
+    developer_out = await _timed_invoke(dev_prompt) if want_dev else None
+    business_out = await _timed_invoke(ba_prompt) if want_ba else None
 
-    return developer_out.text, business_out.text
+    return developer_out, business_out, provider, model
@@ -0,0 +1,132 @@
+import pytest
+
+from services import model_router
+from services.model_router import (
+    infer_provider,
+    record_observation,
+    score_ticket_complexity,
+    select_model,
+)
+
+SMALL_MODEL = "llama-3.1-8b-instant"
+LARGE_MODEL = "llama-3.3-70b-versatile"
+
+SIMPLE_TICKET = {
+    "key": "APP-1",
+    "summary": "Fix typo on login button",
+    "description": "The login button says 'Lgoin'.",
+    "last_comments": "None",
+}
+
+COMPLEX_TICKET = {
+    "key": "APP-2",
+    "summary": "Checkout crashes on submit",
+    "description": "Traceback (most recent call last): NullPointerException "
+                   "at com.shop.Checkout.submit(Checkout.java:42) " + "details " * 700,
+    "last_comments": "None",
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_router(monkeypatch):
+    model_router._observed_stats.clear()
+    for var in ("LLM_PROVIDER", "GROQ_MODEL", "GROQ_SMALL_MODEL", "OPENAI_MODEL",
+                "OPENAI_LARGE_MODEL", "ROUTER_LARGE_TICKET_CHARS", "ROUTER_COMPLEXITY_THRESHOLD"):
+        monkeypatch.delenv(var, raising=False)
+    yield
+    model_router._observed_stats.clear()
+
+
+def test_simple_ticket_scores_zero():
+    assert score_ticket_complexity(SIMPLE_TICKET) == 0
+
+
+def test_complex_ticket_scores_above_threshold():
+    assert score_ticket_complexity(COMPLEX_TICKET) >= 3
+
+
+def test_database_names_are_not_technical_markers():
+    ticket = dict(SIMPLE_TICKET, summary="PostgreSQL upgrade", description="Upgrade MySQL and NoSQL")
+    assert score_ticket_complexity(ticket) == 0
+
+
+def test_repeated_marker_counts_once():
+    ticket = dict(SIMPLE_TICKET, description="exception exception exception")
+    assert score_ticket_complexity(ticket) == 1
+
+
+def test_many_comments_add_a_point():
+    comments = "\n".join(f"- 2024-01-0{i} | dev: note" for i in range(1, 6))
+    assert score_ticket_complexity(dict(SIMPLE_TICKET, last_comments=comments)) == 1
+
+
+def test_simple_ticket_routes_to_small_model():
+    assert select_model(SIMPLE_TICKET, provider="groq") == ("groq", SMALL_MODEL)
+
+
+def test_complex_ticket_routes_to_large_model():
+    assert select_model(COMPLEX_TICKET, provider="groq") == ("groq", LARGE_MODEL)
+
+
+def test_provider_defaults_to_env_then_groq(monkeypatch):
+    assert select_model(SIMPLE_TICKET)[0] == "groq"
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+    assert select_model(SIMPLE_TICKET) == ("openai", "gpt-4o-mini")
+
+
+def test_catalogue_reads_env_at_call_time(monkeypatch):
+    monkeypatch.setenv("GROQ_MODEL", "custom-large")
+    assert select_model(COMPLEX_TICKET, provider="groq") == ("groq", "custom-large")
+
+
+def test_deadline_excludes_slow_models():
+    # Large model prior is 3s per call; two calls do not fit in 4s.
+    assert select_model(COMPLEX_TICKET, provider="groq", deadline_seconds=4, calls=2) == ("groq", SMALL_MODEL)
+
+
+def test_deadline_falls_back_to_fastest_when_nothing_fits():
+    assert select_model(COMPLEX_TICKET, provider="groq", deadline_seconds=0.1, calls=2) == ("groq", SMALL_MODEL)
+
+
+def test_observed_latency_lets_large_model_meet_deadline():
+    record_observation("groq", LARGE_MODEL, latency_s=0.5, estimated_tokens=1000)
+    assert select_model(COMPLEX_TICKET, provider="groq", deadline_seconds=4, calls=2) == ("groq", LARGE_MODEL)
+
+
+def test_simple_ticket_stays_small_after_observation():
+    record_observation("groq", SMALL_MODEL, latency_s=1.0, estimated_tokens=1200)
+    assert select_model(SIMPLE_TICKET, provider="groq") == ("groq", SMALL_MODEL)
+
+
+def test_unsupported_provider_raises():
+    with pytest.raises(ValueError):
+        select_model(SIMPLE_TICKET, provider="acme")
+
+
+def test_record_observation_ewma_update():
+    record_observation("groq", SMALL_MODEL, latency_s=1.0, estimated_tokens=100, actual_tokens=200)
+    record_observation("groq", SMALL_MODEL, latency_s=2.0, estimated_tokens=100, actual_tokens=100)
+    stats = model_router._observed_stats[("groq", SMALL_MODEL)]
+    alpha = model_router.EWMA_ALPHA
+    assert stats["calls"] == 2
+    assert stats["latency_s"] == pytest.approx(alpha * 2.0 + (1 - alpha) * 1.0)
+    assert stats["token_ratio"] == pytest.approx(alpha * 1.0 + (1 - alpha) * 2.0)
+
+
+def test_record_observation_without_usage_keeps_list_price():
+    record_observation("groq", SMALL_MODEL, latency_s=1.0, estimated_tokens=100)
+    assert model_router._observed_stats[("groq", SMALL_MODEL)]["token_ratio"] == 1.0
+
+
+def test_infer_provider_from_catalogue():
+    assert infer_provider("gpt-4o") == "openai"
+    assert infer_provider(LARGE_MODEL) == "groq"
+
+
+def test_infer_provider_trusts_explicit_provider():
+    assert infer_provider("some-new-model", "openai") == "openai"
+
+
+def test_infer_provider_rejects_unknown_model():
+    with pytest.raises(ValueError):
+        infer_provider("some-new-model")